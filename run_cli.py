@@ -1,23 +1,21 @@
 import sys
 import os
 
+# Running from a PyInstaller bundle uses the unpacked temp dir, otherwise this file's directory
+BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.dirname(os.path.abspath(__file__))
+SRC_PATH = os.path.join(BASE_PATH, "src")
+
 
 def main():
     """
     Entry point for the CLI application.
-    Determines the base path depending on whether the script is running from a PyInstaller bundle or as a normal Python script.
-    Modifies the system path to include the 'src' directory, enabling imports of internal modules.
+    Uses the base path determined at import time, depending on whether the script is running from a PyInstaller bundle or as a normal Python script.
+    Adds the 'src' directory to the system path (once), enabling imports of internal modules.
     Delegates execution to the main function of the core.cli module.
     """
-    if hasattr(sys, "_MEIPASS"):
-        # Running from PyInstaller bundle
-        base_path = sys._MEIPASS
-    else:
-        # Running normally
-        base_path = os.path.abspath(os.path.dirname(__file__))
-
     # Add 'src' folder so imports like 'import core.cli' work
-    sys.path.insert(0, os.path.join(base_path, "src"))
+    if SRC_PATH not in sys.path:
+        sys.path.insert(0, SRC_PATH)
 
     import core.cli
 
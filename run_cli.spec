@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('src', 'src')],
-    hiddenimports=['colorama', 'requests', 'art', 'logging.handlers'],
+    hiddenimports=['colorama', 'requests', 'orjson', 'logging.handlers'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
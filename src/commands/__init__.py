@@ -1,6 +1,20 @@
-from commands.chat import Chat
-from commands.echo import Echo
-from commands.clear import Clear
-from commands.help import Help
+import importlib
+
+# Command classes are imported on first access (PEP 562) so that running one
+# command does not pay for importing every other command's dependencies.
+_LAZY_COMMANDS = {
+    "Chat": "commands.chat",
+    "Echo": "commands.echo",
+    "Clear": "commands.clear",
+    "Help": "commands.help",
+    "LLM": "commands.llm",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_COMMANDS:
+        return getattr(importlib.import_module(_LAZY_COMMANDS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ['Chat', 'Echo', 'Clear', 'Help', 'LLM']
@@ -1,12 +1,17 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 import socket
 import threading
+import queue
+import selectors
 import json
 import sys
-from datetime import datetime
+from time import localtime, strftime
 from core.core_types.command import BaseCommand
+from core.config_loader import Config
 from core.logger import get_logger
 
+_LOG = get_logger("chat")
+
 try:
     from colorama import Fore, Style, init as colorama_init
 
@@ -19,6 +24,39 @@ except ImportError:
 
     Fore = Style = _Dummy()
 
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    json_loads = json.loads
+
+
+# Colour segments of a chat line, resolved once instead of per message
+_LINE_START = f"{Fore.CYAN}["
+_LINE_SENDER = f"] {Fore.GREEN}"
+_LINE_RESET = f"{Style.RESET_ALL}: "
+
+
+def format_chat_line(sender: str, msg: str) -> str:
+    """
+    Formats a chat message for the console as "[HH:MM:SS] sender: message" with colours.
+
+    Args:
+        sender (str): The name of the sender.
+        msg (str): The message text.
+
+    Returns:
+        str: The formatted line, without a trailing newline.
+    """
+    ts = strftime("%H:%M:%S", localtime())
+    return "".join((_LINE_START, ts, _LINE_SENDER, sender, _LINE_RESET, msg))
+
 
 def safe_print(msg: str, prompt: str, *, redraw: bool = True) -> None:
     """
@@ -36,6 +74,227 @@ def safe_print(msg: str, prompt: str, *, redraw: bool = True) -> None:
     sys.stdout.flush()
 
 
+def enable_quickack(sock: socket.socket) -> None:
+    """
+    Enables TCP_QUICKACK on the socket where the platform supports it (Linux).
+
+    The kernel clears the flag after each receive, so receive loops call this again
+    before every `recv` to keep ACKs from being delayed.
+
+    Args:
+        sock (socket.socket): The connected socket to update.
+
+    Returns:
+        None
+    """
+    if hasattr(socket, "TCP_QUICKACK"):
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except OSError:
+            pass
+
+
+def tune_socket(sock: socket.socket, chat_cfg: Dict[str, Any]) -> None:
+    """
+    Sizes the kernel send and receive buffers of a chat socket.
+
+    Larger buffers let `broadcast` hand off bursts without stalling in `send()` and
+    let clients drain more data per `recv()` call.
+
+    Args:
+        sock (socket.socket): The socket to tune.
+        chat_cfg (Dict[str, Any]): The "chat" section of the configuration. Reads
+            `send_buffer` and `recv_buffer` (bytes), defaulting to 256 KiB each.
+
+    Returns:
+        None
+    """
+    sock.setsockopt(
+        socket.SOL_SOCKET, socket.SO_SNDBUF, int(chat_cfg.get("send_buffer", 262144))
+    )
+    sock.setsockopt(
+        socket.SOL_SOCKET, socket.SO_RCVBUF, int(chat_cfg.get("recv_buffer", 262144))
+    )
+
+
+FRAME_HEADER_SIZE = 4
+MAX_FRAME_SIZE = 1024 * 1024
+
+
+def encode_frame(payload: bytes) -> bytes:
+    """
+    Prefixes a payload with its length as a 4-byte big-endian integer.
+
+    TCP is a byte stream, so the prefix is what lets the receiver split coalesced
+    or partial reads back into individual messages.
+
+    Args:
+        payload (bytes): The message body.
+
+    Returns:
+        bytes: The framed message, ready to be written to a socket.
+    """
+    return len(payload).to_bytes(FRAME_HEADER_SIZE, "big") + payload
+
+
+def send_frame(sock: socket.socket, payload: bytes) -> None:
+    """
+    Writes a single length-prefixed frame to the socket.
+
+    Args:
+        sock (socket.socket): The connected socket to write to.
+        payload (bytes): The message body.
+
+    Returns:
+        None
+    """
+    sock.sendall(encode_frame(payload))
+
+
+def split_frames(pending: bytearray) -> List[bytes]:
+    """
+    Removes every complete length-prefixed frame from the front of a receive buffer.
+
+    Any trailing partial frame is left in `pending` for the next read to complete.
+
+    Args:
+        pending (bytearray): The connection's receive buffer. Modified in place.
+
+    Returns:
+        List[bytes]: The bodies of the complete frames, in order.
+
+    Raises:
+        ConnectionError: If the peer announces a frame larger than MAX_FRAME_SIZE.
+    """
+    frames = []
+    start = 0
+    available = len(pending)
+    while available - start >= FRAME_HEADER_SIZE:
+        size = int.from_bytes(pending[start : start + FRAME_HEADER_SIZE], "big")
+        if size > MAX_FRAME_SIZE:
+            raise ConnectionError(f"Frame of {size} bytes exceeds limit")
+        end = start + FRAME_HEADER_SIZE + size
+        if available < end:
+            break
+        frames.append(bytes(pending[start + FRAME_HEADER_SIZE : end]))
+        start = end
+    if start:
+        del pending[:start]
+    return frames
+
+
+def recv_frames(sock: socket.socket, bufsize: int = 65536) -> Iterator[bytes]:
+    """
+    Reads length-prefixed frames from a blocking socket until the peer closes the connection.
+
+    Data is read with `recv_into` in chunks of up to `bufsize` bytes and accumulated in a
+    persistent buffer, so any number of frames per read (or frames spanning several reads)
+    are handled. TCP_QUICKACK is re-armed after every successful read.
+
+    Args:
+        sock (socket.socket): The connected socket to read from.
+        bufsize (int, optional): The maximum number of bytes per read. Defaults to 65536.
+
+    Yields:
+        bytes: The body of each complete frame, in order.
+
+    Raises:
+        ConnectionError: If the peer announces a frame larger than MAX_FRAME_SIZE.
+    """
+    pending = bytearray()
+    chunk = bytearray(bufsize)
+    view = memoryview(chunk)
+    while True:
+        n = sock.recv_into(chunk)
+        if not n:
+            return
+        enable_quickack(sock)
+        pending += view[:n]
+        yield from split_frames(pending)
+
+
+SocketOption = Tuple[int, int, int]
+
+DEFAULT_SOCKET_OPTIONS: List[SocketOption] = [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, "TCP_NODELAY"):
+    DEFAULT_SOCKET_OPTIONS.insert(0, (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1))
+
+
+def parse_socket_options(
+    spec: Union[str, List[SocketOption], None],
+) -> List[SocketOption]:
+    """
+    Normalizes the `socket_options` argument of the chat command.
+
+    Accepts either a list of `(level, optname, value)` tuples or a comma-separated
+    string of `LEVEL:OPTNAME:VALUE` triples, where LEVEL and OPTNAME are names of
+    `socket` module constants (e.g. "IPPROTO_TCP:TCP_NODELAY:1,SOL_SOCKET:SO_KEEPALIVE:1")
+    or plain integers.
+
+    Args:
+        spec (str | list | None): The option specification. None selects DEFAULT_SOCKET_OPTIONS.
+
+    Returns:
+        List[SocketOption]: The options as integer `(level, optname, value)` tuples.
+
+    Raises:
+        ValueError: If an entry is malformed or names an unknown socket constant.
+    """
+    if spec is None:
+        return list(DEFAULT_SOCKET_OPTIONS)
+    if not isinstance(spec, str):
+        return [(int(lvl), int(opt), int(val)) for lvl, opt, val in spec]
+
+    def resolve(name: str) -> int:
+        if name.lstrip("-").isdigit():
+            return int(name)
+        value = getattr(socket, name, None)
+        if not isinstance(value, int):
+            raise ValueError(f"Unknown socket constant '{name}'")
+        return value
+
+    options = []
+    for entry in spec.split(","):
+        if not entry.strip():
+            continue
+        parts = [part.strip() for part in entry.split(":")]
+        if len(parts) != 3:
+            raise ValueError(f"Expected LEVEL:OPTNAME:VALUE, got '{entry}'")
+        options.append((resolve(parts[0]), resolve(parts[1]), int(parts[2])))
+    return options
+
+
+class SocketOptionError(OSError):
+    """Raised when the operating system rejects a socket option given to the chat command."""
+
+
+def apply_socket_options(
+    sock: socket.socket, socket_options: List[SocketOption]
+) -> None:
+    """
+    Applies each `(level, optname, value)` tuple to the socket via `setsockopt`.
+
+    Args:
+        sock (socket.socket): The socket to configure.
+        socket_options (List[SocketOption]): The options to set.
+
+    Returns:
+        None
+
+    Raises:
+        SocketOptionError: If the operating system rejects one of the options.
+    """
+    for lvl, opt, val in socket_options:
+        try:
+            sock.setsockopt(lvl, opt, val)
+        except OSError as e:
+            raise SocketOptionError(
+                f"{lvl}:{opt}:{val} was rejected: {e.strerror or e}"
+            ) from e
+
+
 class Chat(BaseCommand):
     """
     Chat command for a client–server chat system.
@@ -47,11 +306,11 @@ class Chat(BaseCommand):
         help (str): Usage instructions for the command.
         fun (bool): Indicates if the command is intended to be fun.
     Methods:
-        execute(*args, **kwargs) -> int:
+        execute(args, kwargs) -> int:
             Parses command-line arguments and starts the chat server or client accordingly.
-        start_server(port: int, host_name: str) -> None:
+        start_server(port: int, host_name: str, socket_options: Optional[List[SocketOption]] = None) -> None:
             Starts a TCP chat server that listens for incoming client connections, manages nicknames, broadcasts messages, and handles disconnections. Allows the host to send messages via the console and gracefully shuts down on interruption.
-        start_client(ip: str, port: int, name: str) -> None:
+        start_client(ip: str, port: int, name: str, socket_options: Optional[List[SocketOption]] = None) -> None:
             Connects to a chat server as a client, sends the user's nickname, listens for incoming messages, and allows the user to send messages via the console. Handles disconnection and shutdown gracefully.
     """
 
@@ -61,26 +320,36 @@ class Chat(BaseCommand):
     help = (
         "Usage:\n"
         "  chat host <port> --name <your_name>\n"
-        "  chat join <ip:port> --name <your_name>"
+        "  chat join <ip:port> --name <your_name>\n"
+        "Options:\n"
+        '  --socket_options "<LEVEL:OPTNAME:VALUE,...>"\n'
+        '      e.g. --socket_options "IPPROTO_TCP:TCP_NODELAY:1,SOL_SOCKET:SO_KEEPALIVE:1" (the default)\n'
+        "      The value must be quoted. A custom list replaces the defaults instead of adding to them,\n"
+        "      so TCP_NODELAY is off unless you include IPPROTO_TCP:TCP_NODELAY:1 yourself."
     )
     fun = False
+    stateless = True
 
-    def execute(self, *args, **kwargs) -> int:
+    def execute(self, args, kwargs) -> int:
         """
         Executes the chat command in either 'host' or 'join' mode.
         Parameters:
-            *args: Variable length argument list.
+            args (list): Positional arguments.
                 - args[0]: mode (str): Either 'host' to start a server or 'join' to connect to a server.
                 - args[1]: target (str): For 'host', the port number as a string. For 'join', the target in 'ip:port' format.
-            **kwargs: Arbitrary keyword arguments.
+            kwargs (dict): Keyword arguments (flags).
                 - name (str, optional): The display name to use. Defaults to "Anonymous".
+                - socket_options (str | list, optional): Socket options to set on every chat socket,
+                  see `parse_socket_options`. Defaults to TCP_NODELAY and SO_KEEPALIVE enabled; a given
+                  list replaces these defaults, so it must name TCP_NODELAY itself to keep it.
         Returns:
             int: 0 on success, 1 on failure.
         Behavior:
             - If insufficient arguments are provided, prints help and returns 1.
             - In 'host' mode, starts a server on the specified port.
             - In 'join' mode, connects to the specified IP and port.
-            - Prints and logs errors for invalid modes or port numbers.
+            - Prints and logs errors for invalid modes, port numbers or socket options, including options the
+              operating system rejects.
         """
         if len(args) < 2:
             print(self.help)
@@ -89,49 +358,111 @@ class Chat(BaseCommand):
         mode, target = args[0], args[1]
         name = kwargs.get("name", "Anonymous")
 
+        try:
+            socket_options = parse_socket_options(kwargs.get("socket_options"))
+        except (TypeError, ValueError) as e:
+            print(f"Invalid socket options: {e}")
+            _LOG.error("Invalid socket options provided: %s", e)
+            return 1
+
+        if mode not in ("host", "join"):
+            print("Invalid mode. Use 'host' or 'join'.")
+            _LOG.error("Invalid mode '%s' provided. Expected 'host' or 'join'.", mode)
+            return 1
+
         try:
             if mode == "host":
-                self.start_server(int(target), name)
-            elif mode == "join":
-                ip, port_str = target.split(":")
-                self.start_client(ip, int(port_str), name)
+                ip, port = None, int(target)
             else:
-                print("Invalid mode. Use 'host' or 'join'.")
-                get_logger("chat").error(
-                    f"Invalid mode '{mode}' provided. Expected 'host' or 'join'."
-                )
-                return 1
+                ip, port_str = target.split(":")
+                port = int(port_str)
+            if not 0 <= port <= 65535:
+                raise ValueError(port)
         except ValueError:
             print("Invalid port number.")
-            get_logger("chat").error(f"Invalid port number '{target}' provided.")
+            _LOG.error("Invalid port number '%s' provided.", target)
+            return 1
+
+        try:
+            if mode == "host":
+                self.start_server(port, name, socket_options)
+            else:
+                self.start_client(ip, port, name, socket_options)
+        except SocketOptionError as e:
+            print(f"Invalid socket options: {e}")
+            _LOG.error("Invalid socket options provided: %s", e)
             return 1
 
         return 0
 
-    def start_server(self, port: int, host_name: str) -> None:
+    def start_server(
+        self,
+        port: int,
+        host_name: str,
+        socket_options: Optional[List[SocketOption]] = None,
+    ) -> None:
         """
         Starts a TCP chat server that listens for incoming client connections and facilitates real-time message broadcasting.
         Args:
             port (int): The port number on which the server will listen for incoming connections.
             host_name (str): The display name to use for the server host when sending messages.
+            socket_options (List[SocketOption], optional): Options applied to the listening socket and every
+                accepted client socket. Defaults to DEFAULT_SOCKET_OPTIONS.
         Behavior:
-            - Accepts multiple client connections using threads.
-            - Receives nicknames from clients and maintains a list of connected clients and their nicknames.
-            - Broadcasts messages from clients and the host to all connected clients.
+            - Serves every socket from a single `selectors` event loop on the calling thread; all sockets are non-blocking.
+            - Accepts at most `chat.max_clients` simultaneous connections.
+            - Listens on all IPv4 and, where supported, IPv6 addresses with SO_REUSEADDR set, so the server can be
+              restarted right away. SO_REUSEPORT is set as well when `chat.reuse_port` is enabled.
+            - Receives nicknames from clients and maintains the set of connected clients and their nicknames.
+            - Broadcasts messages from clients and the host to all connected clients, buffering output for slow clients
+              and disconnecting those whose backlog exceeds `chat.max_pending_bytes`.
             - Handles client disconnections and notifies remaining clients.
-            - Allows the host to send messages via the console.
-            - Gracefully shuts down on KeyboardInterrupt, notifying all clients and closing sockets.
+            - Allows the host to send messages via the console. On POSIX stdin is watched by the same selector; on Windows,
+              where select() only accepts sockets, it is read on a helper thread and handed to the loop through a queue.
+            - Gracefully shuts down on KeyboardInterrupt or end of input, notifying all clients and closing sockets.
         Logging:
             - Logs server events, client connections/disconnections, and message broadcasts using the "chat" logger.
         """
-        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        server.bind(("0.0.0.0", port))
-        server.listen()
+        if socket_options is None:
+            socket_options = DEFAULT_SOCKET_OPTIONS
+        chat_cfg = Config.get_config().get("chat", {})
+        if socket.has_dualstack_ipv6():
+            # One listener for both IPv4 and IPv6 clients
+            server = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
+            server.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 0)
+            bind_addr = ("::", port)
+        else:
+            server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            bind_addr = ("0.0.0.0", port)
+        try:
+            if sys.platform != "win32":
+                # Restart immediately after a crash instead of waiting out TIME_WAIT.
+                # (On Windows SO_REUSEADDR would let another process steal the port.)
+                server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if chat_cfg.get("reuse_port", False) and hasattr(socket, "SO_REUSEPORT"):
+                server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            tune_socket(server, chat_cfg)
+            apply_socket_options(server, socket_options)
+            server.bind(bind_addr)
+            server.listen()
+            server.setblocking(False)
+        except OSError:
+            server.close()
+            raise
         print(f"{Fore.YELLOW}[Hosting] Chat server on port {port}{Style.RESET_ALL}")
-        get_logger("chat").info(f"Hosting chat server on port {port}")
-
-        clients: list[socket.socket] = []
-        nicknames: dict[socket.socket, str] = {}
+        _LOG.info("Hosting chat server on port %s", port)
+
+        sel = selectors.DefaultSelector()
+        # The listening socket is the only registration without per-client state
+        sel.register(server, selectors.EVENT_READ, data=None)
+
+        clients: set[socket.socket] = set()
+        clients_state: dict[socket.socket, Dict[str, Any]] = {}
+        max_pending = int(chat_cfg.get("max_pending_bytes", 1024 * 1024))
+        max_clients = int(chat_cfg.get("max_clients", 64))
+        chunk = bytearray(int(chat_cfg.get("recv_chunk_size", 65536)))
+        chunk_view = memoryview(chunk)
+        host_inputs: queue.Queue = queue.Queue()
         prompt_host = f"{Fore.MAGENTA}(localhost:{port}){Style.RESET_ALL} >> "
 
         running = True
@@ -140,7 +471,9 @@ class Chat(BaseCommand):
             """
             Broadcasts a message to all connected clients.
 
-            Sends the specified message to each client in the `clients` list. If a client connection fails, the client is removed from the list and closed. The message is also printed to the local console with a timestamp and sender information.
+            Appends the framed message to the output buffer of each client in the `clients` set and tries to flush it
+            straight away; whatever the socket does not accept yet is written when it becomes writable again. The message
+            is also printed to the local console with a timestamp and sender information.
 
             Args:
                 msg (str): The message to broadcast.
@@ -152,130 +485,296 @@ class Chat(BaseCommand):
             """
             if not running:
                 return
-            payload = json.dumps({"sender": sender, "message": msg})
-            for cli in clients[:]:
-                try:
-                    cli.send(payload.encode())
-                    get_logger("chat").info(
-                        f"Broadcasting message from {sender}: {msg}"
+            frame = encode_frame(json_dumps({"sender": sender, "message": msg}))
+            _LOG.info("Broadcasting message from %s: %s", sender, msg)
+            # Disconnects are deferred so `clients` is not modified while iterating it
+            dead = []
+            for cli in clients:
+                state = clients_state[cli]
+                state["send_buf"] += frame
+                if len(state["send_buf"]) > max_pending:
+                    _LOG.warning(
+                        "Send backlog full for %s, disconnecting.", state["name"]
                     )
-                except Exception:
-                    clients.remove(cli)
-                    try:
-                        cli.close()
-                    except Exception:
-                        pass
-            ts = datetime.now().strftime("%H:%M:%S")
-            line = f"{Fore.CYAN}[{ts}] {Fore.GREEN}{sender}{Style.RESET_ALL}: {msg}"
-            safe_print(line, prompt_host, redraw=redraw)
-
-        def handle_client(sock: socket.socket):
+                    dead.append(cli)
+                elif not flush(cli):
+                    dead.append(cli)
+            safe_print(format_chat_line(sender, msg), prompt_host, redraw=redraw)
+            for cli in dead:
+                disconnect(cli)
+
+        def flush(sock: socket.socket) -> bool:
             """
-            Handles communication with a connected chat client.
+            Writes as much of a client's pending output as the socket accepts without blocking.
 
-            Receives the client's nickname, adds the client to the active clients list, and broadcasts join/leave messages.
-            Continuously listens for incoming messages from the client and broadcasts them to all connected clients.
-            Cleans up client resources and notifies others when the client disconnects.
+            The client is registered for write readiness only while output remains buffered.
 
             Args:
-                sock (socket.socket): The socket object representing the client connection.
+                sock (socket.socket): The client socket to flush.
 
-            Side Effects:
-                - Modifies the global `clients` list and `nicknames` dictionary.
-                - Sends broadcast messages to all connected clients.
-                - Logs client disconnection events.
+            Returns:
+                bool: False if the connection failed and the caller should disconnect the client, True otherwise.
+            """
+            state = clients_state[sock]
+            send_buf = state["send_buf"]
+            if send_buf:
+                try:
+                    sent = sock.send(send_buf)
+                except (BlockingIOError, InterruptedError):
+                    sent = 0
+                except OSError:
+                    return False
+                del send_buf[:sent]
+            events = selectors.EVENT_READ
+            if send_buf:
+                events |= selectors.EVENT_WRITE
+            if events != state["events"]:
+                state["events"] = events
+                sel.modify(sock, events, data=state)
+            return True
+
+        def disconnect(sock: socket.socket) -> None:
+            """
+            Unregisters and closes a client socket, notifying the others if the client had joined.
+
+            Args:
+                sock (socket.socket): The client socket to drop.
 
-            Exceptions:
-                - Handles exceptions during message receiving and socket closing gracefully.
+            Returns:
+                None
             """
+            state = clients_state.pop(sock, None)
+            if state is None:
+                return
+            clients.discard(sock)
+            sel.unregister(sock)
             try:
-                nickname = sock.recv(1024).decode() or f"Guest-{sock.fileno()}"
-                nicknames[sock] = nickname
-                clients.append(sock)
-                broadcast(f"📢 {nickname} joined the chat!")
-                while running:
-                    try:
-                        data = sock.recv(1024)
-                    except Exception:
-                        break
-                    if not data:
-                        break
-                    broadcast(data.decode(), nickname)
-            finally:
-                if sock in clients:
-                    clients.remove(sock)
-                broadcast(f"❌ {nicknames.get(sock,'Unknown')} left.")
-                get_logger("chat").info(
-                    f"Client {nicknames.get(sock, 'Unknown')} disconnected."
-                )
-                try:
-                    sock.close()
-                except Exception:
-                    pass
+                sock.close()
+            except Exception:
+                pass
+            if state["name"] is not None:
+                broadcast(f"❌ {state['name']} left.")
+                _LOG.info("Client %s disconnected.", state["name"])
 
-        def accept_clients():
+        def accept_client() -> None:
             """
-            Continuously accepts incoming client connections while the server is running.
+            Accepts a pending connection on the listening socket and registers it with the selector.
 
-            For each accepted client socket, starts a new daemon thread to handle the client
-            using the handle_client function. Stops accepting clients if an exception occurs.
+            Connections beyond `chat.max_clients`, and connections whose socket setup fails, are closed straight
+            away without affecting the server.
 
-            Raises:
-                Exception: If an error occurs during client acceptance, the loop breaks.
+            Returns:
+                None
             """
-            while running:
-                try:
-                    client_sock, _ = server.accept()
-                    threading.Thread(
-                        target=handle_client, args=(client_sock,), daemon=True
-                    ).start()
-                except Exception:
+            try:
+                client_sock, addr = server.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                # e.g. EMFILE or ECONNABORTED; the listener itself is still fine
+                _LOG.error("Failed to accept a connection: %s", e)
+                return
+            if len(clients_state) >= max_clients:
+                _LOG.warning("Rejecting %s:%s, server is full.", *addr[:2])
+                client_sock.close()
+                return
+            try:
+                tune_socket(client_sock, chat_cfg)
+                apply_socket_options(client_sock, socket_options)
+                enable_quickack(client_sock)
+                client_sock.setblocking(False)
+            except OSError as e:
+                _LOG.error("Failed to set up connection from %s:%s: %s", *addr[:2], e)
+                client_sock.close()
+                return
+            state = {
+                "name": None,
+                "recv_buf": bytearray(),
+                "send_buf": bytearray(),
+                "events": selectors.EVENT_READ,
+            }
+            clients_state[client_sock] = state
+            sel.register(client_sock, selectors.EVENT_READ, data=state)
+
+        def read_client(sock: socket.socket) -> None:
+            """
+            Reads available data from a client and handles every complete frame in it.
+
+            The first frame from a client is its nickname; it joins `clients` at that point. Later frames are chat
+            messages and are broadcast to everyone. Invalid UTF-8 is decoded with replacement characters.
+
+            Args:
+                sock (socket.socket): The readable client socket.
+
+            Returns:
+                None
+            """
+            state = clients_state.get(sock)
+            if state is None:
+                return
+            try:
+                n = sock.recv_into(chunk)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                n = 0
+            if not n:
+                disconnect(sock)
+                return
+            enable_quickack(sock)
+            state["recv_buf"] += chunk_view[:n]
+            try:
+                frames = split_frames(state["recv_buf"])
+            except ConnectionError:
+                disconnect(sock)
+                return
+            for data in frames:
+                if state["name"] is None:
+                    state["name"] = (
+                        data.decode("utf-8", errors="replace")
+                        or f"Guest-{sock.fileno()}"
+                    )
+                    clients.add(sock)
+                    broadcast(f"📢 {state['name']} joined the chat!")
+                else:
+                    broadcast(data.decode("utf-8", errors="replace"), state["name"])
+                if sock not in clients_state:
                     break
 
-        threading.Thread(target=accept_clients, daemon=True).start()
+        def handle_host_line(msg: Optional[str]) -> None:
+            """
+            Broadcasts a line typed by the host, or stops the server when host input has ended.
+
+            Args:
+                msg (Optional[str]): The line without its newline, or None at end of input.
+
+            Returns:
+                None
+            """
+            nonlocal running
+            if msg is None:
+                running = False
+                return
+            _LOG.info("Host input: %s", msg)
+            if msg.strip():
+                broadcast(msg, host_name, redraw=False)
+
+        def read_host_input() -> None:
+            """
+            Reads host console lines on a helper thread and hands them to the event loop (Windows fallback).
+
+            Posts None when input ends so the loop can shut the server down. A line read after the server has
+            stopped is discarded; the shutdown code waits for it so it cannot end up at the Cmdly prompt.
+
+            Returns:
+                None
+            """
+            try:
+                while running:
+                    line = input(prompt_host)
+                    if running:
+                        host_inputs.put(line)
+            except (EOFError, OSError):
+                host_inputs.put(None)
+
+        # Marks the stdin registration; the listener uses None and clients their state dict
+        stdin_marker = object()
+        input_thread = None
+        try:
+            if sys.platform == "win32":
+                raise OSError("select() only accepts sockets on Windows")
+            sel.register(sys.stdin, selectors.EVENT_READ, data=stdin_marker)
+            sys.stdout.write(prompt_host)
+            sys.stdout.flush()
+        except (AttributeError, ValueError, OSError):
+            # No usable stdin for the selector (Windows, no console, or a regular file under epoll)
+            input_thread = threading.Thread(target=read_host_input, daemon=True)
+            input_thread.start()
 
         try:
             while running:
-                msg = input(prompt_host)
-                get_logger("chat").info(f"Host input: {msg}")
-                if msg.strip():
-                    broadcast(msg, host_name, redraw=False)
+                for key, mask in sel.select(timeout=0.05):
+                    if key.data is None:
+                        accept_client()
+                        continue
+                    if key.data is stdin_marker:
+                        line = sys.stdin.readline()
+                        handle_host_line(line.rstrip("\n") if line else None)
+                        if running:
+                            sys.stdout.write(prompt_host)
+                            sys.stdout.flush()
+                        continue
+                    sock = key.fileobj
+                    # A broadcast earlier in this batch may have disconnected the client
+                    if mask & selectors.EVENT_READ and sock in clients_state:
+                        read_client(sock)
+                    if mask & selectors.EVENT_WRITE and sock in clients_state:
+                        if not flush(sock):
+                            disconnect(sock)
+                while running:
+                    try:
+                        handle_host_line(host_inputs.get_nowait())
+                    except queue.Empty:
+                        break
         except KeyboardInterrupt:
             pass
+        finally:
+            # Runs on errors too, so the port, the selector and every client socket are released
+            running = False
+            print("\n[Server] Shutting down.")
+            _LOG.info("Shutting down chat server.")
 
-        running = False
-        print("\n[Server] Shutting down.")
-        get_logger("chat").info("Shutting down chat server.")
+            goodbye = encode_frame(
+                json_dumps({"sender": "System", "message": "[Server] Shutting down."})
+            )
+            for cli, state in list(clients_state.items()):
+                try:
+                    sel.unregister(cli)
+                    # Flush the backlog and the goodbye with a bounded blocking write
+                    cli.settimeout(1.0)
+                    if state["name"] is not None:
+                        cli.sendall(bytes(state["send_buf"]) + goodbye)
+                except Exception:
+                    pass
+                try:
+                    cli.shutdown(socket.SHUT_RDWR)
+                except Exception:
+                    pass
+                cli.close()
+            clients.clear()
+            clients_state.clear()
 
-        for cli in clients[:]:
-            try:
-                cli.send(
-                    json.dumps(
-                        {"sender": "System", "message": "[Server] Shutting down."}
-                    ).encode()
-                )
-            except Exception:
-                pass
+            sel.unregister(server)
+            sel.close()
             try:
-                cli.shutdown(socket.SHUT_RDWR)
-                cli.close()
+                server.shutdown(socket.SHUT_RDWR)
             except Exception:
                 pass
-        clients.clear()
+            server.close()
 
-        try:
-            server.shutdown(socket.SHUT_RDWR)
-        except Exception:
-            pass
-        server.close()
+            if input_thread is not None and input_thread.is_alive():
+                # The helper thread is still blocked in input(); let it take this line rather than the Cmdly prompt
+                print("[Server] Press Enter to return to Cmdly.")
+                try:
+                    input_thread.join()
+                except KeyboardInterrupt:
+                    pass
 
-    def start_client(self, ip: str, port: int, name: str) -> None:
+    def start_client(
+        self,
+        ip: str,
+        port: int,
+        name: str,
+        socket_options: Optional[List[SocketOption]] = None,
+    ) -> None:
         """
         Starts a chat client that connects to a chat server at the specified IP address and port.
         Args:
             ip (str): The IP address of the chat server to connect to.
             port (int): The port number of the chat server.
             name (str): The name to use as the client's identifier in the chat.
+            socket_options (List[SocketOption], optional): Options applied to the client socket before
+                connecting. Defaults to DEFAULT_SOCKET_OPTIONS.
         Behavior:
             - Establishes a TCP connection to the chat server.
             - Sends the client's name to the server upon connection.
@@ -286,43 +785,54 @@ class Chat(BaseCommand):
         Note:
             This method blocks until the client disconnects or an error occurs.
         """
+        if socket_options is None:
+            socket_options = DEFAULT_SOCKET_OPTIONS
+        chat_cfg = Config.get_config().get("chat", {})
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.connect((ip, port))
-        sock.send(name.encode())
+        try:
+            tune_socket(sock, chat_cfg)
+            apply_socket_options(sock, socket_options)
+            enable_quickack(sock)
+            sock.connect((ip, port))
+            send_frame(sock, name.encode())
+        except OSError:
+            sock.close()
+            raise
 
-        get_logger("chat").info(f"Connected to chat server at {ip}:{port} as {name}")
+        _LOG.info("Connected to chat server at %s:%s as %s", ip, port, name)
 
         prompt_client = f"{Fore.MAGENTA}({ip}:{port}){Style.RESET_ALL} >> "
+        recv_chunk = int(chat_cfg.get("recv_chunk_size", 65536))
 
         running = True
 
         def listen():
             """
             Listens for incoming messages on the socket in a loop while `running` is True.
-            Receives data from the socket, decodes it as JSON, and formats the message with a timestamp and sender information.
+            Receives length-prefixed frames from the socket, decodes each as JSON, and formats the message with a timestamp and sender information.
             Logs received messages and prints them to the client, optionally redrawing the prompt if the sender is not the current user.
             Handles exceptions by breaking the loop and ensures the socket is closed when finished.
             Raises:
                 Exception: If an error occurs during receiving or processing messages.
             """
             nonlocal running
-            while running:
-                try:
-                    data = sock.recv(1024)
-                    if not data:
+            try:
+                for data in recv_frames(sock, recv_chunk):
+                    if not running:
                         break
-                    payload = json.loads(data.decode())
-                    ts = datetime.now().strftime("%H:%M:%S")
-                    line = f"{Fore.CYAN}[{ts}] {Fore.GREEN}{payload['sender']}{Style.RESET_ALL}: {payload['message']}"
+                    payload = json_loads(data)
+                    line = format_chat_line(payload["sender"], payload["message"])
 
-                    get_logger("chat").info(
-                        f"Received message from {payload['sender']}: {payload['message']}"
+                    _LOG.info(
+                        "Received message from %s: %s",
+                        payload["sender"],
+                        payload["message"],
                     )
 
                     redraw = payload["sender"] != name
                     safe_print(line, prompt_client, redraw=redraw)
-                except Exception:
-                    break
+            except Exception:
+                pass
             running = False
             try:
                 sock.close()
@@ -338,7 +848,7 @@ class Chat(BaseCommand):
                     break
                 if msg.strip():
                     try:
-                        sock.send(msg.encode())
+                        send_frame(sock, msg.encode())
                     except Exception:
                         break
         except KeyboardInterrupt:
@@ -346,7 +856,7 @@ class Chat(BaseCommand):
 
         running = False
         print("\n[Client] Disconnected.")
-        get_logger("chat").info("Disconnecting from chat server.")
+        _LOG.info("Disconnecting from chat server.")
         try:
             sock.shutdown(socket.SHUT_RDWR)
         except Exception:
@@ -1,4 +1,5 @@
 import os
+import sys
 from core.core_types.command import BaseCommand
 from core.utils import Utils
 from core.logger import get_logger
@@ -14,16 +15,20 @@ class Clear(BaseCommand):
     description = "Clears the console screen."
     help = "Usage: clear"
     fun = False
+    stateless = True
 
-    def execute(self, *args, **kwargs):
+    def execute(self, args, kwargs):
         """
         Clear the terminal screen.
         Returns:
             int: Exit code, 0 for success.
         """
-        # Windows uses 'cls', Unix uses 'clear'
-        command = "cls" if os.name == "nt" else "clear"
-        os.system(command)
+        if Utils.enable_vt_mode():
+            # Erase the screen and scrollback and home the cursor without spawning a shell
+            sys.stdout.write("\033[2J\033[3J\033[H")
+            sys.stdout.flush()
+        else:
+            os.system("cls")
         get_logger("clear").info("Console cleared successfully.")
 
         Utils.welcome_message()
@@ -12,8 +12,9 @@ class Echo(BaseCommand):
     description = "Echoes the provided arguments."
     help = "Usage: echo <message> [options]"
     fun = False
+    stateless = True
 
-    def execute(self, *args, **kwargs):
+    def execute(self, args, kwargs):
         """
         Print the provided arguments to the console.
         Args:
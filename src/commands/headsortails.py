@@ -13,8 +13,9 @@ class HeadsOrTails(BaseCommand):
     description = "Simulate a coin flip"
     help = "Usage: echo <message> [options]"
     fun = True
+    stateless = True
 
-    def execute(self, *args, **kwargs):
+    def execute(self, args, kwargs):
         """
         Print the provided arguments to the console.
         Args:
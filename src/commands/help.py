@@ -1,11 +1,18 @@
 import os
 import importlib
 import colorama
+from typing import Dict, Optional, Type, Union
 from core.core_types.command import BaseCommand
 from core.logger import get_logger
 
 colorama.init(autoreset=True)
 
+COMMANDS_PATH = os.path.abspath(os.path.dirname(__file__))
+
+# name -> command class (or the exception raised while loading it), see _discover_commands
+_COMMAND_CACHE: Optional[Dict[str, Union[Type[BaseCommand], Exception]]] = None
+_COMMAND_CACHE_MTIME: Optional[float] = None
+
 
 class Help(BaseCommand):
     """
@@ -17,13 +24,14 @@ class Help(BaseCommand):
     description = "Displays help information for available commands."
     help = "Usage: help [command]"
     fun = False
+    stateless = True
 
-    def execute(self, *args, **kwargs):
+    def execute(self, args, kwargs):
         """
         Executes the help command, displaying information about available commands or detailed help for a specific command.
         Args:
-            *args: Optional positional arguments. If provided, the first argument is treated as the command name to display detailed help for.
-            **kwargs: Optional keyword arguments (not used).
+            args (list): Optional positional arguments. If provided, the first argument is treated as the command name to display detailed help for.
+            kwargs (dict): Optional keyword arguments (not used).
         Behavior:
             - If a command name is provided in args, attempts to load and display its description and help text.
             - If no command name is provided, lists all available commands in the commands directory, showing their descriptions.
@@ -31,9 +39,6 @@ class Help(BaseCommand):
             - Logs errors and missing commands using the application's logger.
             - Returns 0 upon completion.
         """
-        commands_path = os.path.join(os.path.dirname(__file__), "..", "commands")
-        commands_path = os.path.abspath(commands_path)
-
         if args:
             command_name = args[0].lower()
             try:
@@ -53,29 +58,59 @@ class Help(BaseCommand):
                 get_logger("help").error(f"Command not found: {command_name}")
         else:
             print("Available commands:\n")
-            for file in os.listdir(commands_path):
-                if file.endswith(".py") and not file.startswith("__"):
-                    name = file[:-3]
-                    try:
-                        module = importlib.import_module(f"commands.{name}")
-                        command_class = self._get_command_class(module)
-
-                        if command_class and getattr(command_class, "fun", False):
-                            print(
-                                f"  {name:<10} - {command_class.description} - {colorama.Fore.MAGENTA}[FUN COMMAND]{colorama.Style.RESET_ALL}"
-                            )
-                        elif command_class:
-                            print(f"  {name:<10} - {command_class.description}")
-                    except Exception as e:
-                        print(f"  {name:<10} - [Error loading: {e}]")
-                        get_logger("help").error(f"Error loading command '{name}': {e}")
+            for name, command_class in self._discover_commands(COMMANDS_PATH).items():
+                if isinstance(command_class, Exception):
+                    print(f"  {name:<10} - [Error loading: {command_class}]")
+                elif getattr(command_class, "fun", False):
+                    print(
+                        f"  {name:<10} - {command_class.description} - {colorama.Fore.MAGENTA}[FUN COMMAND]{colorama.Style.RESET_ALL}"
+                    )
+                else:
+                    print(f"  {name:<10} - {command_class.description}")
 
             print("\nUse 'help [command]' for more info.")
         return 0
 
+    def _discover_commands(self, commands_path):
+        """
+        Returns the command classes found in the commands directory, keyed by command name.
+
+        The directory is scanned and each module imported only on the first call; later calls reuse the cached
+        result until the directory's modification time changes (e.g. a command file is added or removed).
+        Modules that fail to import are cached with the raised exception so the error can be reported.
+
+        Args:
+            commands_path (str): Absolute path of the commands package directory.
+
+        Returns:
+            dict: Mapping of command name to its command class, or to the exception raised while loading it.
+        """
+        global _COMMAND_CACHE, _COMMAND_CACHE_MTIME
+
+        mtime = os.path.getmtime(commands_path)
+        if _COMMAND_CACHE is not None and mtime == _COMMAND_CACHE_MTIME:
+            return _COMMAND_CACHE
+
+        commands = {}
+        for file in os.listdir(commands_path):
+            if file.endswith(".py") and not file.startswith("__"):
+                name = file[:-3]
+                try:
+                    module = importlib.import_module(f"commands.{name}")
+                    command_class = self._get_command_class(module)
+                    if command_class:
+                        commands[name] = command_class
+                except Exception as e:
+                    commands[name] = e
+                    get_logger("help").error(f"Error loading command '{name}': {e}")
+
+        _COMMAND_CACHE = commands
+        _COMMAND_CACHE_MTIME = mtime
+        return commands
+
     def _get_command_class(self, module):
         """
-        Extracts and returns the first class in the given module that is a subclass of BaseCommand (excluding BaseCommand itself).
+        Extracts and returns the first class defined in the given module that is a subclass of BaseCommand (excluding BaseCommand itself).
 
         Args:
             module (module): The module to search for a command class.
@@ -83,12 +118,12 @@ class Help(BaseCommand):
         Returns:
             type or None: The first found subclass of BaseCommand, or None if no such class exists.
         """
-        for attr in dir(module):
-            obj = getattr(module, attr)
+        for obj in vars(module).values():
             if (
                 isinstance(obj, type)
+                and obj.__module__ == module.__name__
+                and obj is not BaseCommand
                 and issubclass(obj, BaseCommand)
-                and obj != BaseCommand
             ):
                 return obj
         return None
@@ -1,22 +1,46 @@
 import json
-import requests
-import threading
-import itertools
 import sys
-import time
 from core.core_types.command import BaseCommand
 from core.config_loader import Config
 from core.logger import get_logger
 
-
 API_ROOT = "https://ai.minoa.cat"
 MODEL = "groq/llama-3.3-70b-versatile"
 
+# Shared across queries so repeat calls reuse the pooled keep-alive connection
+_SESSION = None
+
+
+def _get_session():
+    """
+    Returns the shared HTTP session, creating it on first use.
+
+    `requests` is imported here rather than at module level so that loading the command stays cheap
+    until a query is actually made.
+
+    Returns:
+        requests.Session: The session with the API headers and a small HTTPS connection pool mounted.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+
+        session = requests.Session()
+        session.headers.update(
+            {"Content-Type": "application/json", "Authorization": "Bearer Cmdly"}
+        )
+        session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4),
+        )
+        _SESSION = session
+    return _SESSION
+
 
 class LLM(BaseCommand):
     """
     llm info
-    llm <your prompt here>
+    llm <your prompt here> [--no_stream]
 
     Examples:
         llm info
@@ -26,21 +50,22 @@ class LLM(BaseCommand):
     name = "llm"
     description = "Hack Club AI quick queries"
     fun = True
+    stateless = True
 
-    def execute(self, *args, **kwargs) -> int:
+    def execute(self, args, kwargs) -> int:
         """
         Executes the 'llm' command with the provided arguments.
         If no arguments are given, prints usage instructions and logs a warning.
         If the first argument is 'info', logs the request and displays information about the 'llm' command.
         Otherwise, treats the arguments as a prompt and processes it accordingly.
         Args:
-            *args: Positional arguments passed to the command.
-            **kwargs: Keyword arguments passed to the command.
+            args (list): Positional arguments passed to the command.
+            kwargs (dict): Keyword arguments passed to the command.
         Returns:
             int: Status code indicating the result of the command execution.
         """
         if not args:
-            print("Usage:\n  llm info\n  llm <your prompt>")
+            print("Usage:\n  llm info\n  llm <your prompt> [--no_stream]")
             get_logger("llm").warning("No arguments provided to llm command.")
             return 0
 
@@ -49,7 +74,7 @@ class LLM(BaseCommand):
             return self._do_info()
 
         prompt = " ".join(args)
-        return self._do_query(prompt)
+        return self._do_query(prompt, stream=not kwargs.get("no_stream", False))
 
     def _do_info(self) -> int:
         """
@@ -61,18 +86,22 @@ class LLM(BaseCommand):
         print(MODEL)
         return 0
 
-    def _do_query(self, prompt: str) -> int:
+    def _do_query(self, prompt: str, stream: bool = True) -> int:
         """
-        Sends a prompt to the LLM API and displays the response in the terminal with a spinner animation.
+        Sends a prompt to the LLM API and displays the response in the terminal.
         Args:
             prompt (str): The user input or query to send to the language model.
+            stream (bool, optional): If True, requests a server-sent event stream and prints tokens as they arrive.
+                If False, waits for the complete response behind a "thinking" status line. Defaults to True.
         Returns:
             int: Returns 0 on success, or 1 if an error occurred during the request or response parsing.
         Side Effects:
-            - Prints a spinner animation to the terminal while waiting for the API response.
+            - Prints a "thinking" status line while waiting for a non-streamed API response.
             - Logs the prompt and response using the "llm" logger.
             - Prints the LLM's response or error messages to stdout.
         """
+        import requests
+
         payload = {
             "model": MODEL,
             "temperature": Config.get_config().get("ai", {}).get("temperature", 0.7),
@@ -83,55 +112,39 @@ class LLM(BaseCommand):
                 },
                 {"role": "user", "content": prompt},
             ],
+            "stream": stream,
         }
         get_logger("llm").info(f"LLM query: {prompt}")
 
-        spinner_done = threading.Event()
-
-        def spinner():
-            """
-            Displays an animated spinner in the console to indicate ongoing processing.
-
-            The spinner cycles through a set of Unicode characters to create a spinning effect.
-            It runs until the `spinner_done` event is set, at which point it clears the spinner line
-            and moves the cursor to a new line.
-
-            Assumes `spinner_done` is a threading.Event() and that `itertools`, `sys`, and `time` are imported.
-            """
-            for ch in itertools.cycle("⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"):
-                if spinner_done.is_set():
-                    break
-                sys.stdout.write(f"\r{ch} thinking… ")
-                sys.stdout.flush()
-                time.sleep(0.1)
-            # Clear spinner line, but ALSO move to a fresh line
-            sys.stdout.write("\r\033[K\n")
+        if not stream:
+            # Streamed tokens show progress on their own; otherwise a static status line will do
+            sys.stdout.write("⏳ thinking… ")
             sys.stdout.flush()
 
-        spinner_thread = threading.Thread(target=spinner, daemon=True)
-        spinner_thread.start()
-
         try:
-            resp = requests.post(
+            resp = _get_session().post(
                 f"{API_ROOT}/v1/chat/completions",
                 json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": "Bearer Cmdly",
-                },
+                stream=stream,
                 timeout=60,
             )
             resp.raise_for_status()
         except requests.RequestException as e:
-            spinner_done.set()
-            spinner_thread.join()
+            if not stream:
+                sys.stdout.write("\r\033[K")
             get_logger("llm").error(f"Request failed: {e}")
             print(f"Error during request: {e}")
-            print(resp.text)
+            if e.response is not None:
+                print(e.response.text)
             return 1
 
-        spinner_done.set()
-        spinner_thread.join()  # make sure spinner has finished cleaning up
+        if stream and resp.headers.get("Content-Type", "").startswith(
+            "text/event-stream"
+        ):
+            return self._print_stream(resp)
+
+        if not stream:
+            sys.stdout.write("\r\033[K")
 
         try:
             content = resp.json()["choices"][0]["message"]["content"]
@@ -145,3 +158,48 @@ class LLM(BaseCommand):
         print(content.strip() + "\n")
         get_logger("llm").info(f"LLM response: {content.strip()}")
         return 0
+
+    def _print_stream(self, resp) -> int:
+        """
+        Prints a streamed chat completion token by token as the server sends it.
+        Args:
+            resp (requests.Response): A streaming response carrying OpenAI-style server-sent events.
+        Returns:
+            int: Returns 0 on success, or 1 if the stream broke off or contained an unexpected event.
+        """
+        import requests
+
+        parts = []
+        try:
+            for line in resp.iter_lines(chunk_size=None):
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    break
+                choices = json.loads(data)["choices"]
+                # Some OpenAI-compatible servers end with a usage-only event that has no choices
+                if not choices:
+                    continue
+                delta = choices[0].get("delta", {})
+                token = delta.get("content")
+                if not token:
+                    continue
+                if not parts:
+                    token = token.lstrip()
+                    if not token:
+                        continue
+                sys.stdout.write(token)
+                sys.stdout.flush()
+                parts.append(token)
+        except (requests.RequestException, KeyError, IndexError, ValueError) as e:
+            print(f"\n⚠️ Response stream interrupted: {e}")
+            get_logger("llm").error(f"Error reading LLM response stream: {e}")
+            return 1
+        finally:
+            resp.close()
+
+        # Always leave a blank line after the answer
+        print("\n")
+        get_logger("llm").info(f"LLM response: {''.join(parts).strip()}")
+        return 0
@@ -1,6 +1,7 @@
 import colorama
+import getpass
 import os
-from art import tprint
+import sys
 from core.utils import Utils
 from core.tokenizer import Tokenizer
 from core.parser import Parser
@@ -10,6 +11,44 @@ from core.logger import get_logger
 
 colorama.init(autoreset=True)
 
+# Inputs that end the session; both are four characters long
+_EXIT_CMDS = frozenset({"exit", "quit"})
+
+
+class _PromptFields(dict):
+    """Prompt placeholder values, keyed by placeholder name (without braces)."""
+
+
+def _current_user():
+    """
+    Returns the name of the user running the CLI.
+
+    Returns:
+        str: The login name, or the name from the environment/password database when there is
+        no controlling terminal (e.g. piped input, cron or CI).
+    """
+    try:
+        return os.getlogin()
+    except OSError:
+        return getpass.getuser()
+
+
+def _render_prompt(prompt_fmt, fields):
+    """
+    Expands the placeholders of a prompt format.
+
+    Args:
+        prompt_fmt (str): The prompt format from the configuration, e.g. "{emoji} {username} » ".
+        fields (_PromptFields): The placeholder values.
+
+    Returns:
+        str: The rendered prompt. Every "{name}" with a value is replaced; any other text, braces
+        included, is kept as written.
+    """
+    for key, value in fields.items():
+        prompt_fmt = prompt_fmt.replace("{" + key + "}", value)
+    return prompt_fmt
+
 
 class CLI:
     """
@@ -23,11 +62,13 @@ class CLI:
     Methods:
         __init__(tokenizer, parser_cls, executor):
             Initializes the CLI with the given tokenizer, parser class, and executor.
-            Loads configuration settings.
+            Loads configuration settings and renders the prompt once.
         run():
             Starts the main CLI loop, displaying a welcome message, logging startup information,
             and repeatedly prompting the user for input. Handles special commands, tokenizes and parses
             input, executes commands, and manages errors and keyboard interrupts gracefully.
+        _read_piped(prompt):
+            Reads a line from non-interactive stdin, raising EOFError once it is exhausted.
         _handle_special_commands(raw_input):
             Handles special commands such as 'exit' and 'quit'. Prints a goodbye message,
             logs the exit event, and stops the CLI loop if a special command is detected.
@@ -41,31 +82,34 @@ class CLI:
         self.executor = executor
         self.running = True
         self.config = Config.get_config()
+        # Neither the prompt template nor the user change during a session
+        prompt_cfg = self.config.get("prompt")
+        self._prompt = _render_prompt(
+            prompt_cfg.get("format"),
+            _PromptFields(emoji=prompt_cfg.get("emoji", ""), username=_current_user()),
+        )
+        self._log = get_logger("cli")
+        # Piped input skips input() and its readline hooks
+        self._read = input if sys.stdin.isatty() else self._read_piped
 
     def run(self):
         """
         Runs the main CLI loop, displaying a welcome message, logging startup information, and repeatedly prompting the user for input.
         Processes user commands, handles special commands, tokenizes and parses input, and executes commands.
-        Catches and displays errors, and handles keyboard interrupts gracefully by triggering the exit command.
+        Catches and displays errors, and handles keyboard interrupts and end of input gracefully by triggering the exit command.
         Raises:
             Exception: If an error occurs during command processing.
             KeyboardInterrupt: If the user interrupts the CLI with Ctrl+C.
         """
         Utils.welcome_message()
-        get_logger("cli").info("Starting Cmdly CLI")
-        get_logger("cli").info("Current configuration: %s", self.config)
+        self._log.info("Starting Cmdly CLI")
+        self._log.info("Current configuration: %s", self.config)
 
         while self.running:
             try:
-                prompt = self.config.get("prompt").get("format")
-                prompt = prompt.replace(
-                    "{emoji}", self.config.get("prompt").get("emoji", "")
-                )
-                prompt = prompt.replace("{username}", os.getlogin())
-
-                raw_input = input(prompt).strip()
+                raw_input = self._read(self._prompt).strip()
 
-                get_logger("cli").info(f"User input: {raw_input}")
+                self._log.info("User input: %s", raw_input)
 
                 if self._handle_special_commands(raw_input):
                     continue
@@ -77,11 +121,33 @@ class CLI:
                 for cmd_struct in command_structs:
                     success = self.executor.execute_command(cmd_struct)
 
+            except EOFError:
+                self._handle_special_commands("exit")
             except Exception as e:
                 self._print_error(f"Error: {e}")
             except KeyboardInterrupt:
                 self._handle_special_commands("exit")
 
+    def _read_piped(self, prompt):
+        """
+        Reads one line of non-interactive input, writing the prompt first like input() does.
+
+        Args:
+            prompt (str): The prompt to write before reading.
+
+        Returns:
+            str: The line read, without its trailing newline.
+
+        Raises:
+            EOFError: If the input is exhausted.
+        """
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\n")
+
     def _handle_special_commands(self, raw_input):
         """
         Handles special CLI commands such as 'exit' and 'quit'.
@@ -93,9 +159,9 @@ class CLI:
             - Prints a goodbye message and logs the exit event if a special command is detected.
             - Sets self.running to False to terminate the CLI loop.
         """
-        if raw_input.lower() in ("exit", "quit"):
+        if len(raw_input) == 4 and raw_input.lower() in _EXIT_CMDS:
             print("Goodbye! 👋")
-            get_logger("cli").info("Exiting Cmdly CLI")
+            self._log.info("Exiting Cmdly CLI")
             self.running = False
             return True
 
@@ -127,6 +193,7 @@ def main():
     This function creates instances of the Tokenizer, Executor, and CLI classes,
     then invokes the CLI's run method to begin processing user input.
     """
+    Utils.enable_vt_mode()
     tokenizer = Tokenizer()
     executor = Executor()
     cli = CLI(tokenizer, Parser, executor)
@@ -1,6 +1,19 @@
 import json
 import os
 
+CONFIG_PATH = os.path.normpath(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "config",
+        "default_settings.json",
+    )
+)
+
+# Parsed settings and the file mtime they were read at, see Config.get_config
+_CACHE = None
+_MTIME = None
+
 
 class Config:
     @staticmethod
@@ -8,8 +21,9 @@ class Config:
         """
         Loads and returns the configuration settings from the default_settings.json file.
 
-        The function determines the path to the configuration file relative to the current file's location,
-        opens the JSON file, and parses its contents into a Python dictionary.
+        The file lives at CONFIG_PATH, relative to this module. It is parsed on the first call and the result is
+        cached; later calls only `stat` the file and reparse it if its modification time has changed.
+        The returned dictionary is shared between callers and should be treated as read-only.
 
         Returns:
             dict: The configuration settings loaded from the JSON file.
@@ -18,8 +32,11 @@ class Config:
             FileNotFoundError: If the configuration file does not exist.
             json.JSONDecodeError: If the configuration file contains invalid JSON.
         """
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        config_path = os.path.join(base_dir, "..", "config", "default_settings.json")
-        config_path = os.path.normpath(config_path)
-        with open(config_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        global _CACHE, _MTIME
+
+        mtime = os.stat(CONFIG_PATH).st_mtime
+        if _CACHE is None or mtime != _MTIME:
+            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+                _CACHE = json.load(f)
+            _MTIME = mtime
+        return _CACHE
@@ -6,6 +6,8 @@ class BaseCommand:
     date_created: str = "Unknown"
     description: str = "No description provided"
     help: str = "No help available"
+    # Stateless commands keep nothing between runs, so one instance can be reused
+    stateless: bool = False
 
     def __init__(self):
         pass
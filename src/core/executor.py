@@ -1,6 +1,6 @@
 import importlib
-import inspect
-from typing import List, Dict, Any
+import sys
+from typing import List, Dict, Any, Tuple, Type
 from core.config_loader import Config
 from core.core_types.command import BaseCommand
 from core.logger import get_logger
@@ -31,7 +31,15 @@ class Executor:
 
     def __init__(self, commands_module: str = "commands"):
         self.commands_module = commands_module
-        self.aliases = Config.get_config().get("aliases", {})
+        self._mod_prefix = commands_module + "."
+        config = Config.get_config()
+        self.aliases = config.get("aliases", {})
+        self._fun_enabled = config.get("features", {}).get("fun_commands", True)
+        self._log = get_logger("executor")
+        # command name -> (command class, its "fun" flag), filled on first use
+        self._cmd_cache: Dict[str, Tuple[Type[BaseCommand], bool]] = {}
+        # command name -> reusable instance, only for stateless commands
+        self._instance_cache: Dict[str, BaseCommand] = {}
 
     def run(self, chains: List[Dict[str, Any]]):
         """
@@ -75,9 +83,11 @@ class Executor:
     def execute_command(self, cmd_dict: Dict[str, Any]) -> bool:
         """
         Executes a command specified by the given command dictionary.
-        This method dynamically imports the command module, resolves the command class,
+        This method dynamically imports the command module, resolves the command class
+        (both only on the first use of a command; the result is cached),
         checks for feature flags, and executes the command
         with the provided arguments and keyword arguments.
+        Instances of commands marked `stateless` are reused across calls.
         Args:
             cmd_dict (Dict[str, Any]): A dictionary containing the command information.
                 Expected keys:
@@ -95,43 +105,56 @@ class Executor:
         kwargs = cmd_dict.get("kwargs", {})
 
         try:
-            module = importlib.import_module(
-                f"{self.commands_module}.{cmd_name.lower()}"
-            )
-            CommandClass = None
-            for _, obj in inspect.getmembers(module, inspect.isclass):
-                if issubclass(obj, BaseCommand) and obj is not BaseCommand:
-                    CommandClass = obj
-                    break
-
-            if getattr(CommandClass, "fun", False) and not Config.get_config().get(
-                "features", {}
-            ).get("fun_commands", True):
+            cached = self._cmd_cache.get(cmd_name.lower())
+            if cached is None:
+                mod_name = self._mod_prefix + cmd_name.lower()
+                module = sys.modules.get(mod_name) or importlib.import_module(mod_name)
+                CommandClass = next(
+                    (
+                        obj
+                        for obj in vars(module).values()
+                        if isinstance(obj, type)
+                        and obj.__module__ == module.__name__
+                        and issubclass(obj, BaseCommand)
+                        and obj is not BaseCommand
+                    ),
+                    None,
+                )
+                cached = (CommandClass, getattr(CommandClass, "fun", False))
+                if CommandClass is not None:
+                    self._cmd_cache[cmd_name.lower()] = cached
+            CommandClass, is_fun = cached
+
+            if not self._fun_enabled and is_fun:
                 print(
                     "⚠️  Fun commands are currently disabled. Please enable them in the configuration. (config/default_settings.json)"
                 )
-                get_logger("executor").warning(
+                self._log.warning(
                     "User attempted to run a fun command while fun commands are disabled."
                 )
                 return True
         except (ModuleNotFoundError, AttributeError) as e:
             print(e)
-            get_logger("executor").error(f"Error loading command '{cmd_name}': {e}")
+            self._log.error("Error loading command '%s': %s", cmd_name, e)
             raise ModuleNotFoundError(f"Command not found: {cmd_name}")
             return False
 
         try:
-            cmd_instance = CommandClass()
-            result = cmd_instance.execute(*args, **kwargs)
+            cmd_instance = self._instance_cache.get(cmd_name.lower())
+            if cmd_instance is None:
+                cmd_instance = CommandClass()
+                if getattr(CommandClass, "stateless", False):
+                    self._instance_cache[cmd_name.lower()] = cmd_instance
+            result = cmd_instance.execute(args, kwargs)
             if result != 0:
-                get_logger("executor").error(
-                    f"Command '{cmd_name}' failed with exit code {result}"
+                self._log.error(
+                    "Command '%s' failed with exit code %s", cmd_name, result
                 )
                 print(f"Command '{cmd_name}' failed with exit code {result}")
                 return False
             return True
         except Exception as e:
-            get_logger("executor").error(f"Error executing command '{cmd_name}': {e}")
+            self._log.error("Error executing command '%s': %s", cmd_name, e)
             print(f"Error running command '{cmd_name}': {e}")
             return False
 
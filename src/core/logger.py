@@ -1,40 +1,53 @@
 import logging
 import logging.handlers
-import pathlib
+import os
 import sys
 from datetime import datetime
 from typing import Dict, Any
 
-# Load config once (import-time). Adjust as needed
 from core.config_loader import Config  # noqa: E402
 
-_cfg: Dict[str, Any] = Config.get_config().get("logging", {})
-LEVEL_NAME = _cfg.get("level", "INFO").upper()
-LEVEL = getattr(logging, LEVEL_NAME, logging.INFO)
-KEEP_DAYS = int(_cfg.get("keep_days", 7))
+LOG_DIR = "./logs"
 
+# Logging is configured on the first get_logger() call rather than at import time
+_initialized = False
 
-LOG_DIR = pathlib.Path("./logs/")
 
-LOG_DIR.mkdir(parents=True, exist_ok=True)
-LOG_FILE = LOG_DIR / f"{datetime.now():%Y-%m-%d}.log"
+def _init_logging() -> None:
+    """
+    Configures the root logger with a daily rotating file handler.
+    Reads the "logging" section of the configuration for the level and the number of days to keep.
+    Only the first call has any effect.
+    """
+    global _initialized
+    if _initialized:
+        return
+    _initialized = True
+
+    cfg: Dict[str, Any] = Config.get_config().get("logging", {})
+    level = getattr(logging, cfg.get("level", "INFO").upper(), logging.INFO)
+    keep_days = int(cfg.get("keep_days", 7))
 
-file_handler = logging.handlers.TimedRotatingFileHandler(
-    LOG_FILE, when="midnight", backupCount=KEEP_DAYS, encoding="utf-8"
-)
-file_handler.setFormatter(
-    logging.Formatter(
-        "%(asctime)s | %(levelname)-8s | %(name)s: %(message)s", "%H:%M:%S"
+    os.makedirs(LOG_DIR, exist_ok=True)
+    log_file = os.path.join(LOG_DIR, f"{datetime.now():%Y-%m-%d}.log")
+
+    file_handler = logging.handlers.TimedRotatingFileHandler(
+        log_file, when="midnight", backupCount=keep_days, encoding="utf-8"
+    )
+    file_handler.setFormatter(
+        logging.Formatter(
+            "%(asctime)s | %(levelname)-8s | %(name)s: %(message)s", "%H:%M:%S"
+        )
     )
-)
 
-logging.basicConfig(level=LEVEL, handlers=[file_handler])
-logging.captureWarnings(True)  # capture warnings to log file
+    logging.basicConfig(level=level, handlers=[file_handler])
+    logging.captureWarnings(True)  # capture warnings to log file
 
 
 def get_logger(name: str) -> logging.Logger:
     """
     Returns a logger instance with the specified name.
+    Configures logging on the first call.
 
     Args:
         name (str): The name of the logger to retrieve.
@@ -42,4 +55,6 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         logging.Logger: A logger object corresponding to the given name.
     """
+    if not _initialized:
+        _init_logging()
     return logging.getLogger(name)
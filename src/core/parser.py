@@ -1,11 +1,19 @@
 from typing import List
-from collections import deque
 from core.core_types.tokens import Token, TokType
 
+# Shared end-of-input token returned once the token stream is exhausted
+_EOF = Token(TokType.EOF, "")
+
+# Token types that end a command, separate chained commands, or carry a value
+_TERMINATORS = frozenset({TokType.AND, TokType.OR, TokType.SEMI, TokType.EOF})
+_SEPARATORS = frozenset({TokType.SEMI, TokType.AND, TokType.OR})
+_VALUE_TOKS = frozenset({TokType.COMMAND, TokType.STRING})
+
 
 class Parser:
     def __init__(self, tokens: List[Token]):
-        self.tokens = deque(tokens)
+        self._toks = tokens if isinstance(tokens, list) else list(tokens)
+        self._i = 0
         self.current = None
         self.next_token()
 
@@ -13,23 +21,28 @@ class Parser:
         """
         Advances to the next token in the token stream.
 
-        If there are remaining tokens, sets `self.current` to the next token by removing it from the left of the deque.
+        If there are remaining tokens, sets `self.current` to the token at the current index and moves the index forward.
         If no tokens remain, sets `self.current` to an EOF (end-of-file) token.
         """
-        self.current = self.tokens.popleft() if self.tokens else Token(TokType.EOF, "")
+        i = self._i
+        if i < len(self._toks):
+            self.current = self._toks[i]
+            self._i = i + 1
+        else:
+            self.current = _EOF
 
     def parse(self):
         """
         Parses a sequence of tokens into chains until the end of file (EOF) token is reached.
 
         Returns:
-            list: A list of parsed chains, where each chain is produced by the `parse_chain` method.
+            list: A list of parsed chains, where each chain is produced by the `parse_command` method.
         """
         chains = []
         while self.current.type != TokType.EOF:
-            chain = self.parse_chain()
+            chain = self.parse_command()
             chains.append(chain)
-            if self.current.type in {TokType.SEMI, TokType.AND, TokType.OR}:
+            if self.current.type in _SEPARATORS:
                 separator = self.current.type.name
                 self.next_token()
             else:
@@ -38,22 +51,13 @@ class Parser:
                 pass
         return chains
 
-    def parse_chain(self):
-        """
-        Parses a command chain and returns a dictionary representing the command.
-
-        Returns:
-            dict: A dictionary with a "type" key set to "COMMAND" and additional keys/values
-                  from the parsed command.
-        """
-        return {"type": "COMMAND", **self.parse_command()}
-
     def parse_command(self):
         """
         Parses a command and its arguments from the current token stream.
         Returns:
             dict: A dictionary with the following structure:
                 {
+                    "type": "COMMAND",
                     "cmd": str,
                     "args": list,
                     "kwargs": dict
@@ -76,36 +80,31 @@ class Parser:
         args = []
         kwargs = {}
 
-        while self.current.type not in {
-            TokType.AND,
-            TokType.OR,
-            TokType.SEMI,
-            TokType.EOF,
-        }:
+        while self.current.type not in _TERMINATORS:
             if self.current.type == TokType.FLAG:
                 flag = self.current.value.lstrip("-")
-                if "=" in flag:
-                    k, v = flag.split("=", 1)
+                k, sep, v = flag.partition("=")
+                if sep:
                     kwargs[k] = v
                     self.next_token()
                 else:
                     self.next_token()
-                    if self.current.type in {TokType.COMMAND, TokType.STRING}:
+                    if self.current.type in _VALUE_TOKS:
                         kwargs[flag] = self.current.value
                         self.next_token()
                     else:
                         kwargs[flag] = True
-            elif self.current.type in {TokType.COMMAND, TokType.STRING}:
+            elif self.current.type in _VALUE_TOKS:
                 val = self.current.value
-                if "=" in val:
-                    k, v = val.split("=", 1)
+                k, sep, v = val.partition("=")
+                if sep:
                     kwargs[k] = v
                 else:
                     args.append(val)
                 self.next_token()
             else:
                 break
-        return {"cmd": cmd, "args": args, "kwargs": kwargs}
+        return {"type": "COMMAND", "cmd": cmd, "args": args, "kwargs": kwargs}
 
 
 if __name__ == "__main__":
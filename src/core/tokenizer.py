@@ -1,6 +1,6 @@
 import re
 from enum import Enum, auto
-from typing import Generator, NamedTuple
+from typing import List, NamedTuple
 from core.core_types.tokens import TokType, Token
 
 
@@ -17,8 +17,8 @@ class Tokenizer:
     Methods:
         __init__():
             Initializes the tokenizer with regex patterns for different token types.
-        tokenize(text: str) -> Generator[Token, None, None]:
-            Skips whitespace tokens, removes quotes from string tokens, and yields an EOF token at the end.
+        tokenize(text: str) -> List[Token]:
+            Skips whitespace tokens, removes quotes from string tokens, and appends an EOF token at the end.
             Raises SyntaxError for unexpected characters.
     """
 
@@ -29,57 +29,59 @@ class Tokenizer:
             (TokType.OR, r"\|\|"),
             (TokType.SEMI, r";"),
             (TokType.FLAG, r"--?\w+"),
-            (TokType.STRING, r'"([^"\\]*(\\.[^"\\]*)*)"'),  # Double quotes
-            (TokType.STRING, r"'([^'\\]*(\\.[^'\\]*)*)'"),  # Single quotes
+            (TokType.STRING, r'"(?:[^"\\]|\\.)*"'),  # Double quotes
+            (TokType.STRING, r"'(?:[^'\\]|\\.)*'"),  # Single quotes
             (TokType.COMMAND, r"[a-zA-Z0-9_-]+"),
-            (TokType.MISMATCH, r"."),  # Catch any other character
         ]
         parts = []
         for idx, (tok_type, pattern) in enumerate(self.patterns):
             parts.append(f"(?P<T{idx}>{pattern})")
         self.master_pattern = re.compile("|".join(parts))
+        # Maps each named group of the master pattern back to its token type
+        self._group_to_type = {
+            f"T{idx}": tok_type for idx, (tok_type, _) in enumerate(self.patterns)
+        }
 
-    def tokenize(self, text: str) -> Generator[Token, None, None]:
+    def tokenize(self, text: str) -> List[Token]:
         """
-        Tokenizes the input text and yields Token objects for each recognized token.
+        Tokenizes the input text into a list of Token objects, one for each recognized token.
 
         Args:
             text (str): The input string to tokenize.
 
-        Yields:
-            Token: A token object representing the next token in the input text.
+        Returns:
+            List[Token]: The tokens of the input text, in order, ending with an EOF token.
 
         Raises:
             SyntaxError: If an unexpected character is encountered in the input text.
 
         Notes:
-            - Whitespace tokens are skipped and not yielded.
-            - If a string token is matched, its surrounding quotes are removed before yielding.
-            - At the end of the input, an EOF (end-of-file) token is yielded.
+            - Whitespace tokens are skipped and not included.
+            - If a string token is matched, its surrounding quotes are removed.
+            - At the end of the input, an EOF (end-of-file) token is appended.
         """
-        pos = 0
-        while pos < len(text):
-            match = self.master_pattern.match(text, pos)
-            if not match:
+        tokens = []
+        # Matches must be contiguous; any gap is text no pattern accepts
+        prev_end = 0
+        for match in self.master_pattern.finditer(text):
+            if match.start() != prev_end:
                 raise SyntaxError(
-                    f"Unexpected character: {text[pos]!r} at position {pos}"
+                    f"Unexpected character: {text[prev_end]!r} at position {prev_end}"
                 )
-            for idx, (tok_type, _) in enumerate(self.patterns):
-                group = match.group(f"T{idx}")
-                if group is not None:
-                    if tok_type == TokType.WHITESPACE:
-                        pos = match.end()
-                        break
-                    if tok_type == TokType.MISMATCH:
-                        raise SyntaxError(
-                            f"Unexpected character: {group!r} at position {pos}"
-                        )
-                    if tok_type == TokType.STRING:
-                        group = group[1:-1]
-                    yield Token(tok_type, group)
-                    pos = match.end()
-                    break
-        yield Token(TokType.EOF, "")
+            prev_end = match.end()
+            tok_type = self._group_to_type[match.lastgroup]
+            if tok_type is TokType.WHITESPACE:
+                continue
+            value = match.group()
+            if tok_type is TokType.STRING:
+                value = value[1:-1]
+            tokens.append(Token(tok_type, value))
+        if prev_end != len(text):
+            raise SyntaxError(
+                f"Unexpected character: {text[prev_end]!r} at position {prev_end}"
+            )
+        tokens.append(Token(TokType.EOF, ""))
+        return tokens
 
 
 if __name__ == "__main__":
@@ -1,11 +1,54 @@
-from art import tprint
+import os
+import sys
+
+# Pre-rendered art.text2art("Cmdly"), so startup doesn't load and render a font
+_BANNER = r"""  ____                 _  _        
+ / ___| _ __ ___    __| || | _   _ 
+| |    | '_ ` _ \  / _` || || | | |
+| |___ | | | | | || (_| || || |_| |
+ \____||_| |_| |_| \__,_||_| \__, |
+                             |___/ 
+
+"""
 
 class Utils:
     """A utility class for the Cmdly application, providing static helper methods such as displaying the welcome message."""
+    _vt_enabled = None
+
+    @staticmethod
+    def enable_vt_mode():
+        """
+        Makes sure the console interprets ANSI/VT escape sequences, and reports whether it does.
+
+        Other platforms handle them natively. On Windows 10+ this sets ENABLE_VIRTUAL_TERMINAL_PROCESSING on the
+        console output handle. The result is cached, so only the first call touches the console.
+
+        Returns:
+            bool: True if escape sequences can be written directly to stdout.
+        """
+        if Utils._vt_enabled is None:
+            if os.name != "nt":
+                Utils._vt_enabled = True
+            else:
+                try:
+                    import ctypes
+
+                    kernel32 = ctypes.windll.kernel32
+                    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+                    mode = ctypes.c_uint32()
+                    Utils._vt_enabled = bool(
+                        kernel32.GetConsoleMode(handle, ctypes.byref(mode))
+                        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+                        and kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+                    )
+                except (AttributeError, OSError):
+                    Utils._vt_enabled = False
+        return Utils._vt_enabled
+
     @staticmethod
     def welcome_message():
         """
         Displays a stylized welcome message for the Cmdly application, including instructions for accessing help or exiting.
         """
-        tprint("Cmdly")
+        sys.stdout.write(_BANNER)
         print("Welcome to Cmdly! Type 'help' for a list of commands or 'exit' to quit.\n")
\ No newline at end of file